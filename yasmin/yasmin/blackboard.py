@@ -74,7 +74,7 @@ class Blackboard(object):
         Raises:
             KeyError: If the key is not found in the blackboard.
         """
-        yasmin.YASMIN_LOG_DEBUG(f"Getting '{key}' from the blackboard")
+        yasmin.YASMIN_LOG_DEBUG("Getting '%s' from the blackboard", key)
 
         with self.__lock:
             if not self.__contains__(key):
@@ -96,7 +96,7 @@ class Blackboard(object):
         Raises:
             None
         """
-        yasmin.YASMIN_LOG_DEBUG(f"Setting '{key}' in the blackboard")
+        yasmin.YASMIN_LOG_DEBUG("Setting '%s' in the blackboard", key)
 
         with self.__lock:
             self._data[key] = value
@@ -114,7 +114,7 @@ class Blackboard(object):
         Raises:
             KeyError: If the key is not found in the blackboard.
         """
-        yasmin.YASMIN_LOG_DEBUG(f"Removing '{key}' from the blackboard")
+        yasmin.YASMIN_LOG_DEBUG("Removing '%s' from the blackboard", key)
 
         with self.__lock:
             del self._data[self.__remap(key)]
@@ -132,7 +132,7 @@ class Blackboard(object):
         Raises:
             None
         """
-        yasmin.YASMIN_LOG_DEBUG(f"Checking if '{key}' is in the blackboard")
+        yasmin.YASMIN_LOG_DEBUG("Checking if '%s' is in the blackboard", key)
 
         with self.__lock:
             return self.__remap(key) in self._data
@@ -135,7 +135,7 @@ class Concurrence(State):
 
         if len(satisfied_outcomes) > 1:
             yasmin.YASMIN_LOG_WARN(
-                f"More than one satisfied outcome after concurrent state execution."
+                "More than one satisfied outcome after concurrent state execution."
             )
 
         return satisfied_outcomes[0]
@@ -14,10 +14,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-import inspect
+import sys
 import logging
 from enum import IntEnum
-from typing import Callable, List, Union
+from typing import Any, Callable, List, Union
 
 import yasmin
 
@@ -98,10 +98,10 @@ def get_caller_info() -> List[Union[str, int]]:
     @return: A tuple containing the file name, function name, and line number.
     @rtype: tuple[str, str, int]
     """
-    frame = inspect.stack()[2]
-    file = os.path.basename(frame.filename)
-    line = frame.lineno
-    function = frame.function
+    frame = sys._getframe(2)
+    file = os.path.basename(frame.f_code.co_filename)
+    line = frame.f_lineno
+    function = frame.f_code.co_name
     return file, function, line
 
 
@@ -140,7 +140,9 @@ def default_log_message(
 log_message = default_log_message
 
 
-def log_helper(level: LogLevel, file: str, function: str, line: int, text: str) -> None:
+def log_helper(
+    level: LogLevel, file: str, function: str, line: int, text: str, *args: Any
+) -> None:
     """
     @brief Variadic template function to log messages at different levels.
 
@@ -155,75 +157,94 @@ def log_helper(level: LogLevel, file: str, function: str, line: int, text: str)
     @param function The function where the log function is called.
     @param line The line number in the source file.
     @param text The format string for the log message.
-    @param ... Additional arguments for the format string.
+    @param args Additional arguments for the format string.
     """
 
     if yasmin.log_level >= level:
+        if args:
+            text = text % args
+
         yasmin.log_message(level, file, function, line, text)
 
 
-def YASMIN_LOG_ERROR(text: str) -> None:
+def YASMIN_LOG_ERROR(text: str, *args: Any) -> None:
     """
     Log an error message with the caller's information.
 
     This function formats the log message to include the file name, function
-    name, and line number where the log function was called.
+    name, and line number where the log function was called. The caller's
+    information is only retrieved and the message only formatted if the
+    error messages are enabled.
 
-    @param text: The error message to log.
+    @param text: The error message to log, formatted with args using the % operator.
     @type text: str
+    @param args: Additional arguments for the format string.
 
     @return: None
     """
-    file, function, line = get_caller_info()
-    log_helper(LogLevel.ERROR, file, function, line, text)
+    if yasmin.log_level >= LogLevel.ERROR:
+        file, function, line = get_caller_info()
+        log_helper(LogLevel.ERROR, file, function, line, text, *args)
 
 
-def YASMIN_LOG_WARN(text: str) -> None:
+def YASMIN_LOG_WARN(text: str, *args: Any) -> None:
     """
     Log a warning message with the caller's information.
 
     This function formats the log message to include the file name, function
-    name, and line number where the log function was called.
+    name, and line number where the log function was called. The caller's
+    information is only retrieved and the message only formatted if the
+    warning messages are enabled.
 
-    @param text: The warning message to log.
+    @param text: The warning message to log, formatted with args using the % operator.
     @type text: str
+    @param args: Additional arguments for the format string.
 
     @return: None
     """
-    file, function, line = get_caller_info()
-    log_helper(LogLevel.WARN, file, function, line, text)
+    if yasmin.log_level >= LogLevel.WARN:
+        file, function, line = get_caller_info()
+        log_helper(LogLevel.WARN, file, function, line, text, *args)
 
 
-def YASMIN_LOG_INFO(text: str) -> None:
+def YASMIN_LOG_INFO(text: str, *args: Any) -> None:
     """
     Log an informational message with the caller's information.
 
     This function formats the log message to include the file name, function
-    name, and line number where the log function was called.
+    name, and line number where the log function was called. The caller's
+    information is only retrieved and the message only formatted if the
+    informational messages are enabled.
 
-    @param text: The informational message to log.
+    @param text: The informational message to log, formatted with args using the % operator.
     @type text: str
+    @param args: Additional arguments for the format string.
 
     @return: None
     """
-    file, function, line = get_caller_info()
-    log_helper(LogLevel.INFO, file, function, line, text)
+    if yasmin.log_level >= LogLevel.INFO:
+        file, function, line = get_caller_info()
+        log_helper(LogLevel.INFO, file, function, line, text, *args)
 
 
-def YASMIN_LOG_DEBUG(text: str) -> None:
+def YASMIN_LOG_DEBUG(text: str, *args: Any) -> None:
     """
     Log a debug message with the caller's information.
 
     This function formats the log message to include the file name, function
-    name, and line number where the log function was called.
+    name, and line number where the log function was called. The caller's
+    information is only retrieved and the message only formatted if the
+    debug messages are enabled.
 
-    @param text: The debug message to log.
+    @param text: The debug message to log, formatted with args using the % operator.
     @type text: str
+    @param args: Additional arguments for the format string.
 
     @return: None
     """
-    file, function, line = get_caller_info()
-    log_helper(LogLevel.DEBUG, file, function, line, text)
+    if yasmin.log_level >= LogLevel.DEBUG:
+        file, function, line = get_caller_info()
+        log_helper(LogLevel.DEBUG, file, function, line, text, *args)
 
 
 def set_loggers(new_log_message: Callable[[LogLevel, str], None]) -> None:
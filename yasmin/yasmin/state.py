@@ -46,6 +46,8 @@ class State(ABC):
         __status_lock (threading.Lock): Lock for thread-safe status operations.
     """
 
+    __slots__ = ("_outcomes", "__status", "__status_lock")
+
     def __init__(self, outcomes: Set[str]) -> None:
         """
         Initializes the State instance.
@@ -130,7 +132,7 @@ class State(ABC):
         :return: The outcome of the state execution.
         :raises ValueError: If the outcome is not one of the valid outcomes for this state.
         """
-        yasmin.YASMIN_LOG_DEBUG(f"Executing state '{self}'")
+        yasmin.YASMIN_LOG_DEBUG("Executing state '%s'", self)
 
         self.set_status(StateStatus.RUNNING)
 
@@ -172,7 +174,7 @@ class State(ABC):
 
         Sets the status to CANCELED and logs the cancellation.
         """
-        yasmin.YASMIN_LOG_INFO(f"Canceling state '{self}'")
+        yasmin.YASMIN_LOG_INFO("Canceling state '%s'", self)
         self.set_status(StateStatus.CANCELED)
 
     def get_outcomes(self) -> Set[str]:
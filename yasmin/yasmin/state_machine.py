@@ -127,7 +127,10 @@ class StateMachine(State):
                 )
 
         yasmin.YASMIN_LOG_DEBUG(
-            f"Adding state '{name}' of type '{state}' with transitions: {transition_string}"
+            "Adding state '%s' of type '%s' with transitions: %s",
+            name,
+            state,
+            transition_string,
         )
 
         self._states[name] = {"state": state, "transitions": transitions}
@@ -158,7 +161,7 @@ class StateMachine(State):
         elif state_name not in self._states:
             raise KeyError(f"Initial state '{state_name}' is not in the state machine")
 
-        yasmin.YASMIN_LOG_DEBUG(f"Setting start state to '{state_name}'")
+        yasmin.YASMIN_LOG_DEBUG("Setting start state to '%s'", state_name)
 
         self._start_state: str = state_name
 
@@ -258,7 +261,7 @@ class StateMachine(State):
             for cb, args in self.__start_cbs:
                 cb(blackboard, start_state, *args)
         except Exception as e:
-            yasmin.YASMIN_LOG_ERROR(f"Could not execute start callback: {e}")
+            yasmin.YASMIN_LOG_ERROR("Could not execute start callback: %s", e)
 
     def _call_transition_cbs(
         self,
@@ -283,7 +286,7 @@ class StateMachine(State):
             for cb, args in self.__transition_cbs:
                 cb(blackboard, from_state, to_state, outcome, *args)
         except Exception as e:
-            yasmin.YASMIN_LOG_ERROR(f"Could not execute transition callback: {e}")
+            yasmin.YASMIN_LOG_ERROR("Could not execute transition callback: %s", e)
 
     def _call_end_cbs(self, blackboard: Blackboard, outcome: str) -> None:
         """
@@ -300,7 +303,7 @@ class StateMachine(State):
             for cb, args in self.__end_cbs:
                 cb(blackboard, outcome, *args)
         except Exception as e:
-            yasmin.YASMIN_LOG_ERROR(f"Could not execute end callback: {e}")
+            yasmin.YASMIN_LOG_ERROR("Could not execute end callback: %s", e)
 
     def validate(self, strict_mode: bool = False) -> None:
         """
@@ -313,10 +316,10 @@ class StateMachine(State):
             RuntimeError: If no initial state is set.
             KeyError: If there are any unregistered outcomes or transitions.
         """
-        yasmin.YASMIN_LOG_DEBUG(f"Validating state machine '{self}'")
+        yasmin.YASMIN_LOG_DEBUG("Validating state machine '%s'", self)
 
         if self._validated and not strict_mode:
-            yasmin.YASMIN_LOG_DEBUG(f"State machine '{self}' has already been validated")
+            yasmin.YASMIN_LOG_DEBUG("State machine '%s' has already been validated", self)
 
         # Terminal outcomes from all transitions
         terminal_outcomes = []
@@ -387,7 +390,7 @@ class StateMachine(State):
         self.validate()
 
         yasmin.YASMIN_LOG_INFO(
-            f"Executing state machine with initial state '{self._start_state}'"
+            "Executing state machine with initial state '%s'", self._start_state
         )
         self._call_start_cbs(blackboard, self._start_state)
 
@@ -415,14 +418,17 @@ class StateMachine(State):
             if outcome in self.get_outcomes():
                 self.__set_current_state("")
 
-                yasmin.YASMIN_LOG_INFO(f"State machine ends with outcome '{outcome}'")
+                yasmin.YASMIN_LOG_INFO("State machine ends with outcome '%s'", outcome)
                 self._call_end_cbs(blackboard, outcome)
                 return outcome
 
             # Outcome is a state
             elif outcome in self._states:
                 yasmin.YASMIN_LOG_INFO(
-                    f"State machine transitioning '{self.__current_state}' : '{old_outcome}' --> '{outcome}'"
+                    "State machine transitioning '%s' : '%s' --> '%s'",
+                    self.__current_state,
+                    old_outcome,
+                    outcome,
                 )
 
                 self._call_transition_cbs(
@@ -170,10 +170,13 @@ def main():
     # Create a finite state machine (FSM)
     sm = StateMachine(outcomes=["outcome4"])
 
+    # Create the action state to close it when the FSM is done
+    fibonacci_state = FibonacciState()
+
     # Add states to the FSM
     sm.add_state(
         "CALLING_FIBONACCI",
-        FibonacciState(),
+        fibonacci_state,
         transitions={
             SUCCEED: "PRINTING_RESULT",
             CANCEL: "outcome4",
@@ -203,6 +206,9 @@ def main():
         if sm.is_running():
             sm.cancel_state()  # Cancel the state if interrupted
 
+    # Release the action client of the action state
+    fibonacci_state.close()
+
     # Shutdown ROS 2
     if rclpy.ok():
         rclpy.shutdown()
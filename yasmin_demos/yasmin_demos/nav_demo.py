@@ -190,9 +190,12 @@ def main() -> None:
             HAS_NEXT: "NAVIGATING",
         },
     )
+    # Create the action state to close it when the FSM is done
+    nav2_state = Nav2State()
+
     nav_sm.add_state(
         "NAVIGATING",
-        Nav2State(),
+        nav2_state,
         transitions={
             SUCCEED: "GETTING_NEXT_WAYPOINT",
             CANCEL: CANCEL,
@@ -223,6 +226,9 @@ def main() -> None:
     except KeyboardInterrupt:
         sm.cancel_state()  # Handle manual interruption
 
+    # Release the action client of the action state
+    nav2_state.close()
+
     # Shutdown ROS 2
     if rclpy.ok():
         if sm.is_running():
@@ -15,17 +15,47 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import time
+from threading import Event
+
 import rclpy
+from rclpy.node import Node
+from rclpy.callback_groups import ReentrantCallbackGroup
 
 import yasmin
 from yasmin import State
 from yasmin import Blackboard
 from yasmin import StateMachine
 from yasmin_ros import set_ros_loggers
+from yasmin_ros.yasmin_node import YasminNode
 from yasmin_viewer import YasminViewerPub
 
 
+def sleep_on_node(node: Node, seconds: float) -> None:
+    """
+    Sleeps without blocking the executor that spins the node.
+
+    A one-shot timer of the node wakes the calling thread up, so the executor
+    keeps serving other callbacks meanwhile. Clock.sleep_for is not used, since
+    it is not available on Foxy and Galactic.
+
+    Args:
+        node (Node): The ROS 2 node whose timer is used.
+        seconds (float): The time to sleep, in seconds.
+    """
+    done = Event()
+
+    def wake_up() -> None:
+        timer.cancel()
+        done.set()
+
+    timer = node.create_timer(seconds, wake_up, callback_group=ReentrantCallbackGroup())
+
+    while node.context.ok() and not done.wait(0.1):
+        pass
+
+    node.destroy_timer(timer)
+
+
 # Define the FooState class, inheriting from the State class
 class FooState(State):
     """
@@ -33,18 +63,25 @@ class FooState(State):
 
     Attributes:
         counter (int): Counter to track the number of executions of this state.
+        _node (Node): The ROS 2 node whose timer is used to simulate work.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("counter", "_node")
+
+    def __init__(self, node: Node = None) -> None:
         """
         Initializes the FooState instance, setting up the outcomes.
 
+        Args:
+            node (Node, optional): The ROS 2 node to use. If None, uses the default YasminNode.
+
         Outcomes:
             outcome1: Indicates the state should continue to the Bar state.
             outcome2: Indicates the state should finish execution and return.
         """
         super().__init__(["outcome1", "outcome2"])
         self.counter = 0
+        self._node: Node = node or YasminNode.get_instance()
 
     def execute(self, blackboard: Blackboard) -> str:
         """
@@ -60,7 +97,8 @@ class FooState(State):
             Exception: May raise exceptions related to state execution.
         """
         yasmin.YASMIN_LOG_INFO("Executing state FOO")
-        time.sleep(3)  # Simulate work by sleeping
+        # Simulate work by sleeping on a timer of the node
+        sleep_on_node(self._node, 3)
 
         if self.counter < 3:
             self.counter += 1
@@ -74,16 +112,25 @@ class FooState(State):
 class BarState(State):
     """
     Represents the Bar state in the state machine.
+
+    Attributes:
+        _node (Node): The ROS 2 node whose timer is used to simulate work.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("_node",)
+
+    def __init__(self, node: Node = None) -> None:
         """
         Initializes the BarState instance, setting up the outcome.
 
+        Args:
+            node (Node, optional): The ROS 2 node to use. If None, uses the default YasminNode.
+
         Outcomes:
             outcome3: Indicates the state should transition back to the Foo state.
         """
         super().__init__(outcomes=["outcome3"])
+        self._node: Node = node or YasminNode.get_instance()
 
     def execute(self, blackboard: Blackboard) -> str:
         """
@@ -99,7 +146,8 @@ class BarState(State):
             Exception: May raise exceptions related to state execution.
         """
         yasmin.YASMIN_LOG_INFO("Executing state BAR")
-        time.sleep(3)  # Simulate work by sleeping
+        # Simulate work by sleeping on a timer of the node
+        sleep_on_node(self._node, 3)
 
         yasmin.YASMIN_LOG_INFO(blackboard["foo_str"])
         return "outcome3"
@@ -111,15 +159,20 @@ def main():
     The main entry point of the application.
 
     Initializes the ROS 2 environment, sets up the state machine,
-    and handles execution and termination.
+    and handles execution and termination. If ROS 2 is already
+    initialized, e.g. by a test harness running the demo repeatedly,
+    it is reused and left running.
 
     Raises:
         KeyboardInterrupt: If the execution is interrupted by the user.
     """
     yasmin.YASMIN_LOG_INFO("yasmin_demo")
 
-    # Initialize ROS 2
-    rclpy.init()
+    # Initialize ROS 2 if it is not running yet
+    init_ros = not rclpy.ok()
+
+    if init_ros:
+        rclpy.init()
 
     # Set ROS 2 loggers
     set_ros_loggers()
@@ -145,7 +198,7 @@ def main():
     )
 
     # Publish FSM information for visualization
-    YasminViewerPub("yasmin_demo", sm)
+    viewer = YasminViewerPub("yasmin_demo", sm)
 
     # Execute the FSM
     try:
@@ -155,8 +208,12 @@ def main():
         if sm.is_running():
             sm.cancel_state()
 
-    # Shutdown ROS 2 if it's running
-    if rclpy.ok():
+    # Stop publishing the FSM if ROS 2 keeps running after this call
+    if not init_ros:
+        viewer.destroy()
+
+    # Shutdown ROS 2 if it was initialized here and it's running
+    if init_ros and rclpy.ok():
         rclpy.shutdown()
 
 
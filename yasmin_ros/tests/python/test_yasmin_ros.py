@@ -18,7 +18,9 @@ import time
 import unittest
 from threading import Thread
 
+from yasmin import Blackboard
 from yasmin_ros import ActionState, ServiceState, MonitorState
+from yasmin_ros.yasmin_node import YasminNode
 from yasmin_ros.basic_outcomes import SUCCEED, CANCEL, ABORT, TIMEOUT
 
 from example_interfaces.action import Fibonacci
@@ -56,6 +58,9 @@ class AuxNode(Node):
         self.timer = self.create_timer(1, self.publis_msgs)
 
     def goal_callback(self, goal_request) -> int:
+        if goal_request.order > 100:
+            return GoalResponse.REJECT
+
         return GoalResponse.ACCEPT
 
     def handle_accepted_callback(self, goal_handle) -> None:
@@ -70,7 +75,12 @@ class AuxNode(Node):
             goal_handle.abort()
 
         else:
-            time.sleep(3)
+            feedback = Fibonacci.Feedback()
+            feedback.sequence = [request.order]
+
+            for _ in range(30):
+                goal_handle.publish_feedback(feedback)
+                time.sleep(0.1)
 
             if goal_handle.is_cancel_requested:
                 goal_handle.canceled()
@@ -117,6 +127,7 @@ class TestYasminRos(unittest.TestCase):
             return goal
 
         state = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state.close)
         self.assertEqual(SUCCEED, state())
 
     def test_action_result_handler(self):
@@ -132,8 +143,54 @@ class TestYasminRos(unittest.TestCase):
         state = ActionState(
             Fibonacci, "test", create_goal_cb, ["new_outcome"], result_handler
         )
+        self.addCleanup(state.close)
         self.assertEqual("new_outcome", state())
 
+    def test_action_feedback_handler(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 0
+            return goal
+
+        def feedback_handler(blackboard, feedback):
+            blackboard["feedbacks"] += 1
+
+        blackboard = Blackboard()
+        blackboard["feedbacks"] = 0
+
+        state = ActionState(
+            Fibonacci, "test", create_goal_cb, feedback_handler=feedback_handler
+        )
+        self.addCleanup(state.close)
+        self.assertEqual(SUCCEED, state(blackboard))
+        self.assertGreater(blackboard["feedbacks"], 5)
+
+    def test_action_feedback_period(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 0
+            return goal
+
+        def feedback_handler(blackboard, feedback):
+            blackboard["feedbacks"] += 1
+
+        blackboard = Blackboard()
+        blackboard["feedbacks"] = 0
+
+        state = ActionState(
+            Fibonacci,
+            "test",
+            create_goal_cb,
+            feedback_handler=feedback_handler,
+            feedback_period=1.0,
+        )
+        self.addCleanup(state.close)
+        self.assertEqual(SUCCEED, state(blackboard))
+        self.assertGreater(blackboard["feedbacks"], 0)
+        self.assertLessEqual(blackboard["feedbacks"], 5)
+
     def test_action_cancel(self):
 
         def create_goal_cb(blackboard):
@@ -146,6 +203,7 @@ class TestYasminRos(unittest.TestCase):
             state.cancel_state()
 
         state = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state.close)
         thread = Thread(
             target=cancel_state,
             args=(
@@ -157,6 +215,139 @@ class TestYasminRos(unittest.TestCase):
         self.assertEqual(CANCEL, state())
         thread.join()
 
+    def test_action_concurrent(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = blackboard["order"]
+            return goal
+
+        def run_state(state, blackboard, outcomes):
+            outcomes[blackboard["order"]] = state(blackboard)
+
+        state = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state.close)
+        outcomes = {}
+        threads = []
+
+        for order in (0, -1):
+            blackboard = Blackboard()
+            blackboard["order"] = order
+            threads.append(Thread(target=run_state, args=(state, blackboard, outcomes)))
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({0: SUCCEED, -1: ABORT}, outcomes)
+
+    def test_action_feedback_routing(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = blackboard["order"]
+            return goal
+
+        def feedback_handler(blackboard, feedback):
+            blackboard["orders"].add(feedback.sequence[0])
+
+        state = ActionState(
+            Fibonacci, "test", create_goal_cb, feedback_handler=feedback_handler
+        )
+        self.addCleanup(state.close)
+        blackboards = []
+        threads = []
+
+        for order in (1, 2):
+            blackboard = Blackboard()
+            blackboard["order"] = order
+            blackboard["orders"] = set()
+            blackboards.append(blackboard)
+            threads.append(Thread(target=state, args=(blackboard,)))
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({1}, blackboards[0]["orders"])
+        self.assertEqual({2}, blackboards[1]["orders"])
+
+    def test_action_cancel_after_send(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 20
+            return goal
+
+        state = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state.close)
+        outcomes = []
+        thread = Thread(target=lambda: outcomes.append(state()))
+        thread.start()
+
+        # Cancel as soon as the goal is sent, before its response arrives
+        while not state._invocations and thread.is_alive():
+            time.sleep(0.001)
+
+        state.cancel_state()
+        thread.join()
+        self.assertEqual([CANCEL], outcomes)
+
+    def run_tasks(self, coroutines):
+        executor = YasminNode.get_instance().executor
+        tasks = [executor.create_task(coroutine) for coroutine in coroutines]
+
+        while not all(task.done() for task in tasks):
+            time.sleep(0.1)
+
+        return [task.result() for task in tasks]
+
+    def test_action_aexecute(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 0
+            return goal
+
+        def result_handler(blackboard, result):
+            return "new_outcome"
+
+        state1 = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state1.close)
+        state2 = ActionState(
+            Fibonacci, "test", create_goal_cb, ["new_outcome"], result_handler
+        )
+        self.addCleanup(state2.close)
+
+        outcomes = self.run_tasks(
+            [state1.aexecute(Blackboard()), state2.aexecute(Blackboard())]
+        )
+        self.assertEqual([SUCCEED, "new_outcome"], outcomes)
+
+    def test_action_aexecute_rejected(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 1000
+            return goal
+
+        state = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state.close)
+        self.assertEqual([ABORT], self.run_tasks([state.aexecute(Blackboard())]))
+
+    def test_action_aexecute_timeout(self):
+
+        def create_goal_cb(blackboard):
+            return Fibonacci.Goal()
+
+        state = ActionState(Fibonacci, "test_unavailable", create_goal_cb, timeout=1)
+        self.addCleanup(state.close)
+        self.assertEqual([TIMEOUT], self.run_tasks([state.aexecute(Blackboard())]))
+
     def test_action_abort(self):
 
         def create_goal_cb(blackboard):
@@ -165,8 +356,101 @@ class TestYasminRos(unittest.TestCase):
             return goal
 
         state = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state.close)
         self.assertEqual(ABORT, state())
 
+    def test_action_cache_goal(self):
+
+        def create_goal_cb(blackboard):
+            blackboard["goals"] += 1
+            goal = Fibonacci.Goal()
+            goal.order = 0
+            return goal
+
+        blackboard = Blackboard()
+        blackboard["goals"] = 0
+
+        state = ActionState(Fibonacci, "test", create_goal_cb, cache_goal=True)
+        self.addCleanup(state.close)
+        self.assertEqual(SUCCEED, state(blackboard))
+        self.assertEqual(SUCCEED, state(blackboard))
+        self.assertEqual(1, blackboard["goals"])
+
+    def test_action_unspun_node(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 0
+            return goal
+
+        node = Node("unspun_node")
+
+        self.addCleanup(node.destroy_node)
+
+        state1 = ActionState(Fibonacci, "test", create_goal_cb, node=node)
+        state2 = ActionState(Fibonacci, "test", create_goal_cb, node=node)
+
+        self.assertEqual(SUCCEED, state1())
+        self.assertEqual(SUCCEED, state2())
+        self.assertEqual(SUCCEED, state1())
+
+        # The executor spinning the node is shut down with its last state
+        state1.close()
+        self.assertIn(node, ActionState._spin_executors)
+        state2.close()
+        self.assertNotIn(node, ActionState._spin_executors)
+        self.assertIsNone(node.executor)
+
+    def test_action_shared_client(self):
+
+        def create_goal_cb(blackboard):
+            return Fibonacci.Goal()
+
+        state1 = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state1.close)
+        state2 = ActionState(Fibonacci, "test", create_goal_cb)
+        self.addCleanup(state2.close)
+        state3 = ActionState(Fibonacci, "test2", create_goal_cb)
+        self.addCleanup(state3.close)
+        self.assertIs(state1._action_client, state2._action_client)
+        self.assertIsNot(state1._action_client, state3._action_client)
+
+    def test_action_close(self):
+
+        def create_goal_cb(blackboard):
+            return Fibonacci.Goal()
+
+        state1 = ActionState(Fibonacci, "test_close", create_goal_cb)
+        state2 = ActionState(Fibonacci, "test_close", create_goal_cb)
+        client = state1._action_client
+
+        state1.close()
+        state3 = ActionState(Fibonacci, "test_close", create_goal_cb)
+        self.assertIs(client, state3._action_client)
+
+        state2.close()
+        state3.close()
+        state4 = ActionState(Fibonacci, "test_close", create_goal_cb)
+        self.assertIsNot(client, state4._action_client)
+        state4.close()
+
+    def test_action_close_running(self):
+
+        def create_goal_cb(blackboard):
+            goal = Fibonacci.Goal()
+            goal.order = 20
+            return goal
+
+        state = ActionState(Fibonacci, "test", create_goal_cb)
+        outcomes = []
+        thread = Thread(target=lambda: outcomes.append(state()))
+        thread.start()
+
+        time.sleep(1)
+        state.close()
+        thread.join()
+        self.assertEqual([CANCEL], outcomes)
+
     def test_service(self):
 
         def create_request_cb(blackboard):
@@ -13,15 +13,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Set, Callable, Type, Any
-from threading import RLock, Event
+import uuid
+from typing import Set, Dict, List, Tuple, Callable, Type, Any
+from threading import Lock, Condition, Event
 
 from rclpy.node import Node
 from rclpy.task import Future
+from rclpy.timer import Timer
+from rclpy.executors import Executor, SingleThreadedExecutor
 from rclpy.action import ActionClient
 from rclpy.action.client import ClientGoalHandle
-from rclpy.callback_groups import CallbackGroup
+from rclpy.callback_groups import CallbackGroup, ReentrantCallbackGroup
 from action_msgs.msg import GoalStatus
+from unique_identifier_msgs.msg import UUID
 
 import yasmin
 from yasmin import State
@@ -30,6 +34,126 @@ from yasmin_ros.yasmin_node import YasminNode
 from yasmin_ros.basic_outcomes import SUCCEED, ABORT, CANCEL, TIMEOUT
 
 
+class _ActionClientPool:
+    """
+    Process-wide pool of the action clients used by the action states.
+
+    Action states that use the same action of the same node with the same
+    callback group share a single action client, so duplicated clients do not
+    grow the wait set of the executor. Clients are reference counted and
+    destroyed when the last state using them releases them.
+
+    Attributes:
+        _lock (Lock): Lock to control access to the pool.
+        _clients (Dict[Tuple, List]): Pooled clients and their reference counts by key.
+    """
+
+    ## Lock to control access to the pool.
+    _lock: Lock = Lock()
+    ## Pooled clients and their reference counts by key.
+    _clients: Dict[Tuple, List] = {}
+
+    @staticmethod
+    def acquire(
+        node: Node,
+        action_type: Type,
+        action_name: str,
+        callback_group: CallbackGroup = None,
+    ) -> ActionClient:
+        """
+        Gets an action client from the pool, creating it if needed.
+
+        Parameters:
+            node (Node): The ROS 2 node of the action client.
+            action_type (Type): The type of the action.
+            action_name (str): The name of the action.
+            callback_group (CallbackGroup, optional): The callback group for the action client. If None, a new ReentrantCallbackGroup is used when the client is created.
+
+        Returns:
+            ActionClient: The shared action client.
+        """
+        key = (node, action_type, action_name, callback_group)
+
+        with _ActionClientPool._lock:
+            entry = _ActionClientPool._clients.get(key)
+
+            if entry is None:
+                client = ActionClient(
+                    node,
+                    action_type,
+                    action_name,
+                    callback_group=callback_group or ReentrantCallbackGroup(),
+                )
+                entry = [client, 0]
+                _ActionClientPool._clients[key] = entry
+
+            entry[1] += 1
+            return entry[0]
+
+    @staticmethod
+    def release(client: ActionClient) -> None:
+        """
+        Releases an action client acquired from the pool.
+
+        The client is destroyed when it is no longer used by any state.
+
+        Parameters:
+            client (ActionClient): The action client to release.
+        """
+        with _ActionClientPool._lock:
+            for key, entry in _ActionClientPool._clients.items():
+                if entry[0] is client:
+                    entry[1] -= 1
+
+                    if entry[1] == 0:
+                        del _ActionClientPool._clients[key]
+                        client.destroy()
+
+                    return
+
+
+class _Invocation:
+    """
+    State of a single execution of an action state.
+
+    Each execution keeps its own goal handle and result future, so
+    concurrent executions of the same state never see each other's goal.
+
+    Attributes:
+        blackboard (Blackboard): The blackboard of the execution.
+        goal_handle (ClientGoalHandle): Handle for the goal sent to the action server.
+        get_result_future (Future): Future of the result of the goal.
+        latest_feedback (Any): The latest feedback not yet passed to the feedback handler.
+        cancel_requested (bool): Whether the goal must be canceled.
+    """
+
+    __slots__ = (
+        "blackboard",
+        "goal_handle",
+        "get_result_future",
+        "latest_feedback",
+        "cancel_requested",
+    )
+
+    def __init__(self, blackboard: Blackboard) -> None:
+        """
+        Initializes the invocation of an execution.
+
+        Parameters:
+            blackboard (Blackboard): The blackboard of the execution.
+        """
+        ## The blackboard of the execution.
+        self.blackboard: Blackboard = blackboard
+        ## Handle for the goal sent to the action server.
+        self.goal_handle: ClientGoalHandle = None
+        ## Future of the result of the goal.
+        self.get_result_future: Future = None
+        ## The latest feedback not yet passed to the feedback handler.
+        self.latest_feedback: Any = None
+        ## Whether the goal must be canceled.
+        self.cancel_requested: bool = False
+
+
 class ActionState(State):
     """
     Represents a state that interacts with a ROS 2 action server.
@@ -40,18 +164,54 @@ class ActionState(State):
     Attributes:
         _node (Node): The ROS 2 node instance used to communicate with the action server.
         _action_name (str): The name of the action to be performed.
-        _action_client (ActionClient): The action client used to send goals.
-        _action_done_event (Event): Event used to wait for action completion.
-        _action_result (Any): The result returned by the action server.
-        _action_status (GoalStatus): The status of the action execution.
-        _goal_handle (ClientGoalHandle): Handle for the goal sent to the action server.
-        _goal_handle_lock (RLock): Lock to manage access to the goal handle.
+        _action_client (ActionClient): The action client used to send goals, shared with the states using the same action.
+        _callback_group (CallbackGroup): The callback group used by the action client.
+        _invocations (Dict[bytes, _Invocation]): State of the current executions by goal id.
+        _goal_handle_lock (Lock): Lock to manage access to the current executions.
+        _invocations_done (Condition): Condition notified when no executions are active anymore.
         _create_goal_handler (Callable[[Blackboard], Any]): Function that creates the goal to send.
+        _cache_goal (bool): Whether the first created goal is reused by the next executions.
+        _cached_goal (Any): The goal reused by the next executions.
         _result_handler (Callable[[Blackboard, Any], str]): Function to handle the result from the action server.
         _feedback_handler (Callable[[Blackboard, Any], None]): Function to handle feedback from the action server.
+        _feedback_lock (Lock): Lock to manage access to the latest feedback and to serialize the batched feedback handler calls.
+        _feedback_timer (Timer): Timer that passes the latest feedback to the feedback handler periodically.
         _timeout (float): Timeout duration for waiting for the action server.
+        _STATUS_OUTCOMES (Dict[int, str]): Outcomes of the terminal goal statuses.
+        _spin_executors (Dict[Node, List]): Executors created to spin the nodes that are not spun by any other executor, with the locks serializing their spinning and the number of states using each node.
+        _spin_executors_lock (Lock): Lock to manage access to the spin executors.
     """
 
+    __slots__ = (
+        "_node",
+        "_action_name",
+        "_action_client",
+        "_callback_group",
+        "_invocations",
+        "_goal_handle_lock",
+        "_invocations_done",
+        "_create_goal_handler",
+        "_cache_goal",
+        "_cached_goal",
+        "_result_handler",
+        "_feedback_handler",
+        "_feedback_lock",
+        "_feedback_timer",
+        "_timeout",
+    )
+
+    ## Outcomes of the terminal goal statuses.
+    _STATUS_OUTCOMES: Dict[int, str] = {
+        GoalStatus.STATUS_CANCELED: CANCEL,
+        GoalStatus.STATUS_ABORTED: ABORT,
+        GoalStatus.STATUS_SUCCEEDED: SUCCEED,
+    }
+
+    ## Executors created to spin the nodes that are not spun by any other executor.
+    _spin_executors: Dict[Node, List] = {}
+    ## Lock to manage access to the spin executors.
+    _spin_executors_lock: Lock = Lock()
+
     def __init__(
         self,
         action_type: Type,
@@ -63,6 +223,8 @@ class ActionState(State):
         callback_group: CallbackGroup = None,
         node: Node = None,
         timeout: float = None,
+        feedback_period: float = None,
+        cache_goal: bool = False,
     ) -> None:
         """
         Initializes the ActionState instance.
@@ -76,31 +238,37 @@ class ActionState(State):
             outcomes (Set[str], optional): Additional outcomes that this state can return.
             result_handler (Callable[[Blackboard, Any], str], optional): A function to process the result of the action.
             feedback_handler (Callable[[Blackboard, Any], None], optional): A function to process feedback from the action.
-            callback_group (CallbackGroup, optional): The callback group for the action client.
+            callback_group (CallbackGroup, optional): The callback group for the action client. If None, a ReentrantCallbackGroup is used.
             node (Node, optional): The ROS 2 node to use. If None, uses the default YasminNode.
             timeout (float, optional): Timeout duration for waiting for the action server.
+            feedback_period (float, optional): If set, only the latest feedback is passed to the feedback handler every period, in seconds, instead of every feedback message.
+            cache_goal (bool, optional): If True, the goal created by the first execution is reused by the next ones. The create_goal_handler must then always create the same goal.
 
         Raises:
             ValueError: If create_goal_handler is None.
         """
 
-        ## Event used to wait for action completion.
-        self._action_done_event: Event = Event()
-        ## The result returned by the action server.
-        self._action_result: Any = None
-        ## The status of the action execution.
-        self._action_status: GoalStatus = None
-        ## Handle for the goal sent to the action server.
-        self._goal_handle: ClientGoalHandle = None
-        ## Lock to manage access to the goal handle.
-        self._goal_handle_lock: RLock = RLock()
+        ## State of the current executions by goal id.
+        self._invocations: Dict[bytes, _Invocation] = {}
+        ## Lock to manage access to the current executions.
+        self._goal_handle_lock: Lock = Lock()
+        ## Condition notified when no executions are active anymore.
+        self._invocations_done: Condition = Condition(self._goal_handle_lock)
 
         ## Function that creates the goal to send.
         self._create_goal_handler: Callable[[Blackboard], Any] = create_goal_handler
+        ## Whether the first created goal is reused by the next executions.
+        self._cache_goal: bool = cache_goal
+        ## The goal reused by the next executions.
+        self._cached_goal: Any = None
         ## Function to handle the result from the action server.
         self._result_handler: Callable[[Blackboard, Any], str] = result_handler
         ## Function to handle feedback from the action server.
         self._feedback_handler: Callable[[Blackboard, Any], None] = feedback_handler
+        ## Lock to manage access to the latest feedback and to serialize the batched feedback handler calls.
+        self._feedback_lock: Lock = Lock()
+        ## Timer that passes the latest feedback to the feedback handler periodically.
+        self._feedback_timer: Timer = None
 
         ## Timeout duration for waiting for the action server.
         self._timeout: float = timeout
@@ -122,16 +290,30 @@ class ActionState(State):
         ## The name of the action to be performed.
         self._action_name: str = action_name
 
-        ## The action client used to send goals.
-        self._action_client: ActionClient = ActionClient(
+        if not self._create_goal_handler:
+            raise ValueError("create_goal_handler is needed")
+
+        ## The action client used to send goals, shared with the states using the same action.
+        self._action_client: ActionClient = _ActionClientPool.acquire(
             self._node,
             action_type,
             action_name,
-            callback_group=callback_group,
+            callback_group,
         )
 
-        if not self._create_goal_handler:
-            raise ValueError("create_goal_handler is needed")
+        self._acquire_spin_executor()
+
+        ## The callback group used by the action client.
+        self._callback_group: CallbackGroup = self._action_client.callback_group
+
+        if feedback_period and self._feedback_handler is not None:
+            self._feedback_timer = self._node.create_timer(
+                feedback_period,
+                self._flush_feedback,
+                callback_group=self._callback_group,
+            )
+            # The timer only runs while goals are active
+            self._feedback_timer.cancel()
 
         super().__init__(_outcomes)
 
@@ -139,14 +321,67 @@ class ActionState(State):
         """
         Cancels the current action state.
 
-        This method cancels the goal sent to the action server, if it exists.
+        This method requests to cancel the goals sent to the action server, if any.
+        Goals that are not accepted yet are canceled as soon as they are accepted.
         """
         with self._goal_handle_lock:
-            if self._goal_handle is not None:
-                self._goal_handle.cancel_goal()
+            goal_handles = []
+
+            for invocation in self._invocations.values():
+                invocation.cancel_requested = True
+
+                if invocation.goal_handle is not None:
+                    goal_handles.append(invocation.goal_handle)
+
+        for goal_handle in goal_handles:
+            goal_handle.cancel_goal_async()
 
         super().cancel_state()
 
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Releases the ROS 2 resources of the action state.
+
+        This method cancels the current goals, if any, including the ones sent by
+        aexecute, and waits for them to finish. Then, it destroys the feedback timer
+        and releases the action client, which is destroyed once no other state
+        uses it. The executor created to spin the node, if any, is shut down once
+        no other state uses the node. It must not be called from the callbacks of
+        the state, and the state must not be executed after being closed.
+
+        Parameters:
+            timeout (float, optional): Maximum time in seconds to wait for the current goals to finish. If None, waits without limit.
+        """
+        if self._action_client is None:
+            return
+
+        with self._goal_handle_lock:
+            active = bool(self._invocations)
+
+        if active:
+            self.cancel_state()
+
+        # Wait for the canceled goals to finish before releasing their client
+        with self._invocations_done:
+            finished = self._invocations_done.wait_for(
+                lambda: not self._invocations, timeout
+            )
+
+        if not finished:
+            yasmin.YASMIN_LOG_WARN(
+                "Goals of action '%s' did not finish in %s seconds, closing anyway",
+                self._action_name,
+                timeout,
+            )
+
+        if self._feedback_timer is not None:
+            self._node.destroy_timer(self._feedback_timer)
+            self._feedback_timer = None
+
+        _ActionClientPool.release(self._action_client)
+        self._action_client = None
+        self._release_spin_executor()
+
     def execute(self, blackboard: Blackboard) -> str:
         """
         Executes the action state by sending a goal to the action server.
@@ -163,71 +398,383 @@ class ActionState(State):
         Raises:
             Exception: Raises an exception if any error occurs during action execution.
         """
+        goal = self._get_goal(blackboard)
+
+        if not self._wait_for_server():
+            return TIMEOUT
+
+        invocation = _Invocation(blackboard)
+
+        try:
+            send_goal_future = self._send_goal(invocation, goal)
+
+            if not self._wait_for_future(send_goal_future):
+                return ABORT
+
+            if not self._goal_response_callback(send_goal_future, invocation):
+                return ABORT
+
+            # Wait for action to be done
+            if not self._wait_for_future(invocation.get_result_future):
+                return ABORT
+
+            return self._process_result(invocation, invocation.get_result_future.result())
+
+        finally:
+            # Forget the execution however it ended
+            self._finish_invocation(invocation)
+
+    async def aexecute(self, blackboard: Blackboard) -> str:
+        """
+        Executes the action state as a coroutine.
+
+        This method performs the same steps as execute, but awaits the goal and
+        result futures instead of blocking the calling thread. It must run as a
+        task of the executor that spins the node, for instance with
+        node.executor.create_task(state.aexecute(blackboard)), so several action
+        states can run concurrently on a single executor thread. Waiting for an
+        action server that is not available yet still blocks.
+
+        Parameters:
+            blackboard (Blackboard): The blackboard instance used for state management.
+
+        Returns:
+            str: The outcome of the action execution (e.g., SUCCEED, ABORT, CANCEL, TIMEOUT).
+        """
+        goal = self._get_goal(blackboard)
+
+        if not self._wait_for_server():
+            return TIMEOUT
+
+        invocation = _Invocation(blackboard)
+
+        try:
+            send_goal_future = self._send_goal(invocation, goal)
+            await send_goal_future
+
+            if not self._goal_response_callback(send_goal_future, invocation):
+                return ABORT
+
+            await invocation.get_result_future
+
+            return self._process_result(invocation, invocation.get_result_future.result())
+
+        finally:
+            # Forget the execution however it ended
+            self._finish_invocation(invocation)
+
+    def _get_goal(self, blackboard: Blackboard) -> Any:
+        """
+        Gets the goal to send, reusing the cached goal if goal caching is enabled.
+
+        Parameters:
+            blackboard (Blackboard): The blackboard passed to the create_goal_handler.
+
+        Returns:
+            Any: The goal to send.
+        """
+        if self._cached_goal is not None:
+            return self._cached_goal
+
         goal = self._create_goal_handler(blackboard)
 
-        yasmin.YASMIN_LOG_INFO(f"Waiting for action '{self._action_name}'")
+        if self._cache_goal:
+            self._cached_goal = goal
+
+        return goal
+
+    def _wait_for_server(self) -> bool:
+        """
+        Waits for the action server to be available.
+
+        The server is checked without waiting first, so waiting is only needed
+        when it is not available yet.
+
+        Returns:
+            bool: True if the action server is available, False if the timeout was reached.
+        """
+        if self._action_client.server_is_ready():
+            return True
+
+        yasmin.YASMIN_LOG_INFO("Waiting for action '%s'", self._action_name)
         act_available = self._action_client.wait_for_server(self._timeout)
 
         if not act_available:
             yasmin.YASMIN_LOG_WARN(
-                f"Timeout reached, action '{self._action_name}' is not available"
+                "Timeout reached, action '%s' is not available", self._action_name
             )
-            return TIMEOUT
+            return False
 
-        self._action_done_event.clear()
+        return True
 
-        yasmin.YASMIN_LOG_INFO(f"Sending goal to action '{self._action_name}'")
+    def _send_goal(self, invocation: _Invocation, goal: Any) -> Future:
+        """
+        Sends a goal to the action server.
+
+        The goal id is generated here, so the execution is registered before
+        any feedback of the goal can arrive.
+
+        Parameters:
+            invocation (_Invocation): The state of the execution sending the goal.
+            goal: The goal to send.
+
+        Returns:
+            Future: The future of the goal response.
+        """
+        yasmin.YASMIN_LOG_INFO("Sending goal to action '%s'", self._action_name)
+
+        goal_uuid = UUID(uuid=list(uuid.uuid4().bytes))
+
+        with self._goal_handle_lock:
+            if not self._invocations and self._feedback_timer is not None:
+                self._feedback_timer.reset()
 
-        def feedback_handler(feedback):
-            if self._feedback_handler is not None:
-                self._feedback_handler(blackboard, feedback.feedback)
+            self._invocations[bytes(goal_uuid.uuid)] = invocation
 
-        send_goal_future = self._action_client.send_goal_async(
-            goal, feedback_callback=feedback_handler
+        return self._action_client.send_goal_async(
+            goal,
+            feedback_callback=(
+                self._feedback_callback if self._feedback_handler is not None else None
+            ),
+            goal_uuid=goal_uuid,
         )
-        send_goal_future.add_done_callback(self._goal_response_callback)
 
-        # Wait for action to be done
-        self._action_done_event.wait()
-        status = self._action_status
+    def _finish_invocation(self, invocation: _Invocation) -> None:
+        """
+        Forgets a finished execution so its goal is not canceled by later calls.
+
+        Pending feedback of the execution is passed to the feedback handler, and
+        the feedback timer is stopped when no goals are active anymore.
 
-        if status == GoalStatus.STATUS_CANCELED:
-            return CANCEL
+        Parameters:
+            invocation (_Invocation): The state of the finished execution.
+        """
+        with self._goal_handle_lock:
+            for goal_id, other in self._invocations.items():
+                if other is invocation:
+                    del self._invocations[goal_id]
+                    break
+
+            if not self._invocations and self._feedback_timer is not None:
+                self._feedback_timer.cancel()
 
-        elif status == GoalStatus.STATUS_ABORTED:
-            return ABORT
+        if self._feedback_timer is not None:
+            self._flush_invocation_feedback(invocation)
+
+        with self._invocations_done:
+            if not self._invocations:
+                self._invocations_done.notify_all()
+
+    def _process_result(self, invocation: _Invocation, response: Any) -> str:
+        """
+        Processes the result response of the finished goal.
+
+        This method passes the pending feedback of the execution, if any, to the
+        feedback handler before the result handler sees the result, and maps the
+        status of the goal to an outcome.
+
+        Parameters:
+            invocation (_Invocation): The state of the finished execution.
+            response: The result response received from the action server.
+
+        Returns:
+            str: The outcome of the action execution.
+        """
+        if self._feedback_timer is not None:
+            self._flush_invocation_feedback(invocation)
 
-        elif status == GoalStatus.STATUS_SUCCEEDED:
-            if self._result_handler is not None:
-                return self._result_handler(blackboard, self._action_result)
+        outcome = self._STATUS_OUTCOMES.get(response.status, ABORT)
 
-            return SUCCEED
+        if outcome == SUCCEED and self._result_handler is not None:
+            return self._result_handler(invocation.blackboard, response.result)
 
-        return ABORT
+        return outcome
 
-    def _goal_response_callback(self, future: Future) -> None:
+    def _feedback_callback(self, feedback: Any) -> None:
         """
-        Callback to handle the response from sending a goal.
+        Callback to handle the feedback of the current goals.
 
-        This method retrieves the goal handle and sets up the result callback.
+        This method forwards the feedback to the feedback handler together with
+        the blackboard of the execution that sent the goal. If a feedback period
+        is set, the feedback is only stored until the feedback timer passes it on.
 
         Parameters:
-            future: The future object representing the result of the goal sending operation.
+            feedback: The feedback message received from the action server.
+        """
+        invocation = self._invocations.get(bytes(feedback.goal_id.uuid))
+
+        if invocation is None:
+            return
+
+        if self._feedback_timer is None:
+            self._feedback_handler(invocation.blackboard, feedback.feedback)
+            return
+
+        with self._feedback_lock:
+            invocation.latest_feedback = feedback.feedback
+
+    def _flush_feedback(self) -> None:
+        """
+        Passes the latest stored feedback of the current goals to the feedback handler.
         """
         with self._goal_handle_lock:
-            self._goal_handle: ClientGoalHandle = future.result()
-            get_result_future = self._goal_handle.get_result_async()
-            get_result_future.add_done_callback(self._get_result_callback)
+            invocations = list(self._invocations.values())
+
+        for invocation in invocations:
+            self._flush_invocation_feedback(invocation)
 
-    def _get_result_callback(self, future: Future) -> None:
+    def _flush_invocation_feedback(self, invocation: _Invocation) -> None:
         """
-        Callback to handle the result of the executed action.
+        Passes the latest stored feedback of an execution, if any, to the feedback handler.
 
-        This method sets the action result and status, and signals that the action is done.
+        The handler is called while holding the feedback lock, so the timer and
+        the end of the execution never pass an older feedback after a newer one.
 
         Parameters:
-            future: The future object representing the result of the action execution.
+            invocation (_Invocation): The state of the execution.
+        """
+        with self._feedback_lock:
+            feedback = invocation.latest_feedback
+            invocation.latest_feedback = None
+
+            if feedback is not None:
+                self._feedback_handler(invocation.blackboard, feedback)
+
+    def _wait_for_future(self, future: Future) -> bool:
         """
-        self._action_result: Any = future.result().result
-        self._action_status: GoalStatus = future.result().status
-        self._action_done_event.set()
+        Blocks until the given future is done.
+
+        If the future is already done, this method returns right away. If the node
+        is spun by an executor, it waits for the future to be completed by that
+        executor. Otherwise, it spins the node itself until the future is done or
+        the context is shut down, so the state also works with nodes that are not
+        spun.
+
+        Parameters:
+            future: The future object to wait for.
+
+        Returns:
+            bool: True if the future is done, False if the context was shut down before.
+        """
+        if future.done():
+            return True
+
+        spin_executor = self._get_spin_executor()
+
+        if spin_executor is not None:
+            executor, spin_lock = spin_executor
+
+            while self._node.context.ok() and not future.done():
+                with spin_lock:
+                    executor.spin_once(timeout_sec=0.1)
+
+            if not future.done():
+                yasmin.YASMIN_LOG_WARN(
+                    "Context shut down while waiting for action '%s'", self._action_name
+                )
+                return False
+
+            return True
+
+        done_event = Event()
+        future.add_done_callback(lambda _: done_event.set())
+        done_event.wait()
+        return True
+
+    def _acquire_spin_executor(self) -> None:
+        """
+        Registers the state as a user of the spin executor of its node.
+
+        The executor itself is only created when the state has to wait and the
+        node is not spun by any other executor.
+        """
+        with ActionState._spin_executors_lock:
+            entry = ActionState._spin_executors.get(self._node)
+
+            if entry is None:
+                entry = [None, Lock(), 0]
+                ActionState._spin_executors[self._node] = entry
+
+            entry[2] += 1
+
+    def _release_spin_executor(self) -> None:
+        """
+        Unregisters the state as a user of the spin executor of its node.
+
+        The executor is removed from the node and shut down when no other state
+        uses the node.
+        """
+        with ActionState._spin_executors_lock:
+            entry = ActionState._spin_executors[self._node]
+            entry[2] -= 1
+
+            if entry[2] > 0:
+                return
+
+            del ActionState._spin_executors[self._node]
+            executor = entry[0]
+
+            if executor is None:
+                return
+
+            with entry[1]:
+                if self._node.executor is executor:
+                    self._node.executor = None
+
+                executor.shutdown()
+
+    def _get_spin_executor(self) -> Tuple[Executor, Lock]:
+        """
+        Gets the executor used to spin the node while waiting.
+
+        The executor belongs to the node, not to the state, so all the action
+        states using a node that is not spun by any other executor share it.
+
+        Returns:
+            Tuple[Executor, Lock]: The executor created to spin the node and the lock serializing its spinning, or None if the node is spun by another executor.
+        """
+        with ActionState._spin_executors_lock:
+            executor = self._node.executor
+            entry = ActionState._spin_executors[self._node]
+
+            if entry[0] is not None and entry[0] is executor:
+                return entry[0], entry[1]
+
+            if executor is not None:
+                return None
+
+            executor = SingleThreadedExecutor(context=self._node.context)
+            executor.add_node(self._node)
+            entry[0] = executor
+            return executor, entry[1]
+
+    def _goal_response_callback(self, future: Future, invocation: _Invocation) -> bool:
+        """
+        Handles the response from sending a goal.
+
+        This method retrieves the goal handle and, if the goal was accepted,
+        requests the result of the goal. If the state was canceled while the
+        goal was being sent, the goal is canceled right away.
+
+        Parameters:
+            future: The future object representing the result of the goal sending operation.
+            invocation (_Invocation): The state of the execution that sent the goal.
+
+        Returns:
+            bool: True if the goal was accepted, False otherwise.
+        """
+        goal_handle: ClientGoalHandle = future.result()
+
+        if goal_handle is None or not goal_handle.accepted:
+            yasmin.YASMIN_LOG_WARN("Goal rejected by action '%s'", self._action_name)
+            return False
+
+        with self._goal_handle_lock:
+            invocation.goal_handle = goal_handle
+            invocation.get_result_future = goal_handle.get_result_async()
+            cancel_requested = invocation.cancel_requested
+
+        if cancel_requested:
+            goal_handle.cancel_goal_async()
+
+        return True
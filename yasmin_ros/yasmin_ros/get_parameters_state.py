@@ -70,7 +70,7 @@ class GetParametersState(State):
             if not self._node.has_parameter(param_name):
                 self._node.declare_parameter(param_name, param_value)
 
-            yasmin.YASMIN_LOG_INFO(f"Retrieving parameter '{param_name}'")
+            yasmin.YASMIN_LOG_INFO("Retrieving parameter '%s'", param_name)
 
             parameter = self._node.get_parameter(param_name).get_parameter_value()
             parameter_type = rclpy.Parameter.Type(
@@ -97,7 +97,9 @@ class GetParametersState(State):
                 value = parameter.byte_array_value
             else:
                 yasmin.YASMIN_LOG_ERROR(
-                    f"Unsupported parameter type for '{param_name}': {self._node.get_parameter_type(param_name)}"
+                    "Unsupported parameter type for '%s': %s",
+                    param_name,
+                    self._node.get_parameter_type(param_name),
                 )
                 return ABORT
 
@@ -166,11 +166,11 @@ class MonitorState(State):
 
             if self._timeout is not None and not flag:
                 yasmin.YASMIN_LOG_WARN(
-                    f"Timeout reached, topic '{self._topic_name}' is not available"
+                    "Timeout reached, topic '%s' is not available", self._topic_name
                 )
                 return TIMEOUT
 
-        yasmin.YASMIN_LOG_INFO(f"Processing msg from topic '{self._topic_name}'")
+        yasmin.YASMIN_LOG_INFO("Processing msg from topic '%s'", self._topic_name)
         outcome = self._monitor_handler(blackboard, self.msg_list.pop(0))
 
         return outcome
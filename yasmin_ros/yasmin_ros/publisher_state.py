@@ -101,7 +101,7 @@ class PublisherState(State):
             time exceeds the specified timeout.
         """
 
-        yasmin.YASMIN_LOG_DEBUG(f"Publishing to topic '{self._topic_name}'")
+        yasmin.YASMIN_LOG_DEBUG("Publishing to topic '%s'", self._topic_name)
         msg = self._create_message_handler(blackboard)
         self._pub.publish(msg)
         return SUCCEED
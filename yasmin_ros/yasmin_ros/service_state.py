@@ -110,7 +110,8 @@ class ServiceState(State):
         Executes the service call.
 
         This method prepares the request using the provided blackboard,
-        waits for the service to become available, and sends the request.
+        waits for the service to become available if it is not ready yet,
+        and sends the request.
         It also handles the response and can process outcomes based on the
         response handler.
 
@@ -125,21 +126,24 @@ class ServiceState(State):
         """
         request = self._create_request_handler(blackboard)
 
-        yasmin.YASMIN_LOG_INFO(f"Waiting for service '{self._srv_name}'")
-        srv_available = self._service_client.wait_for_service(timeout_sec=self._timeout)
-
-        if not srv_available:
-            yasmin.YASMIN_LOG_WARN(
-                f"Timeout reached, service '{self._srv_name}' is not available"
+        if not self._service_client.service_is_ready():
+            yasmin.YASMIN_LOG_INFO("Waiting for service '%s'", self._srv_name)
+            srv_available = self._service_client.wait_for_service(
+                timeout_sec=self._timeout
             )
-            return TIMEOUT
+
+            if not srv_available:
+                yasmin.YASMIN_LOG_WARN(
+                    "Timeout reached, service '%s' is not available", self._srv_name
+                )
+                return TIMEOUT
 
         try:
-            yasmin.YASMIN_LOG_INFO(f"Sending request to service '{self._srv_name}'")
+            yasmin.YASMIN_LOG_INFO("Sending request to service '%s'", self._srv_name)
             response = self._service_client.call(request)
 
         except Exception as e:
-            yasmin.YASMIN_LOG_WARN(f"Service call failed: {e}")
+            yasmin.YASMIN_LOG_WARN("Service call failed: %s", e)
             return ABORT
 
         if self._response_handler:
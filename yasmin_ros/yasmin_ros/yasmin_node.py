@@ -32,7 +32,7 @@ class YasminNode(Node):
     - _instance: The single instance of YasminNode.
     - _lock: A reentrant lock for thread safety.
     - _executor: An instance of MultiThreadedExecutor to manage node execution.
-    - _spin_thread: A thread that runs the executor's spin method.
+    - _spin_thread: A daemon thread that runs the executor's spin method.
 
     @exception RuntimeError Raised when attempting to instantiate the node more than once.
     """
@@ -81,5 +81,5 @@ class YasminNode(Node):
         self._executor.add_node(self)
 
         ## Thread to execute the spinning of the node.
-        self._spin_thread: Thread = Thread(target=self._executor.spin)
+        self._spin_thread: Thread = Thread(target=self._executor.spin, daemon=True)
         self._spin_thread.start()
@@ -15,6 +15,7 @@
 
 from typing import Dict, List
 from rclpy.node import Node
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
 import yasmin
 from yasmin import StateMachine, State
 from yasmin_ros.yasmin_node import YasminNode
@@ -34,12 +35,14 @@ class YasminViewerPub:
         _fsm (StateMachine): The finite state machine to be published.
         _fsm_name (str): The name of the finite state machine.
         pub: The publisher for the state machine messages.
+        _callback_group: The callback group used by the publishing timer.
         _timer: A timer to periodically publish the FSM state.
 
     Methods:
         parse_transitions(transitions): Converts a dictionary of transitions to a list of TransitionMsg.
         parse_state(state_name, state_info, states_list, parent): Parses a state and its children recursively.
         _publish_data(): Publishes the current state of the FSM.
+        destroy(): Destroys the timer and the publisher of the FSM.
     """
 
     def __init__(
@@ -80,8 +83,26 @@ class YasminViewerPub:
         ## The publisher for the state machine messages.
         self.pub = self._node.create_publisher(StateMachineMsg, "/fsm_viewer", 10)
 
+        ## The callback group used by the publishing timer.
+        self._callback_group = MutuallyExclusiveCallbackGroup()
+
         ## A timer to periodically publish the FSM state.
-        self._timer = self._node.create_timer(1 / rate, self._publish_data)
+        self._timer = self._node.create_timer(
+            1 / rate, self._publish_data, callback_group=self._callback_group
+        )
+
+    def destroy(self) -> None:
+        """
+        Destroys the timer and the publisher of the FSM.
+
+        After this call, the FSM is no longer published. This allows creating
+        new publishers on a node that outlives the FSM, such as the YasminNode.
+
+        Returns:
+            None
+        """
+        self._node.destroy_timer(self._timer)
+        self._node.destroy_publisher(self.pub)
 
     def parse_transitions(self, transitions: Dict[str, str]) -> List[TransitionMsg]:
         """
@@ -188,11 +209,13 @@ class YasminViewerPub:
             state_machine_msg.states = states_list
 
             yasmin.YASMIN_LOG_DEBUG(
-                f"Publishing data of state machine '{self._fsm_name}'"
+                "Publishing data of state machine '%s'", self._fsm_name
             )
             self.pub.publish(state_machine_msg)
 
         except Exception as e:
             yasmin.YASMIN_LOG_ERROR(
-                f"Not publishing state machine '{self._fsm_name}' due to validation failure: {e}"
+                "Not publishing state machine '%s' due to validation failure: %s",
+                self._fsm_name,
+                e,
             )